@@ -1,26 +1,45 @@
 """CLI interface for the Claude orchestrator."""
 
-import asyncio
+import os
+import shlex
+import shutil
 import sys
 import typer
-from datetime import datetime
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-import structlog
 
-from ..core.claude_orchestrator import ClaudeOrchestrator
+# Rich, asyncio and the orchestrator are imported inside the commands that need
+# them, so --help and shell completion stay fast.
+_console = None
+
+
+def _get_console():
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def _confirm(message: str) -> bool:
+    """Ask for confirmation, declining without prompting when stdin is not a terminal."""
+    if not sys.stdin.isatty():
+        _get_console().print("[yellow]⚠️ No terminal to confirm on; pass --yes to proceed[/yellow]")
+        return False
+    return typer.confirm(message)
+
+
+# Monitoring interval assumed when estimating cycles in `history`
+_HISTORY_CYCLE_SECONDS = 15 * 60
+
+# Trading styles accepted by `config --style`
+_VALID_STYLES = frozenset({"aggressive", "moderate", "cautious", "conservative"})
 
-# Initialize console and logger
-console = Console()
-logger = structlog.get_logger(__name__)
 
 # Create Typer app
 app = typer.Typer(
     name="claude-trader",
     help="24/7 Claude Trading Orchestrator",
-    rich_markup_mode="rich"
+    rich_markup_mode=None
 )
 
 
@@ -62,6 +81,11 @@ def start(
     )
 ):
     """Start 24/7 automated trading with Claude."""
+    import asyncio
+    from rich.panel import Panel
+    from ..core.claude_orchestrator import ClaudeOrchestrator
+    
+    console = _get_console()
     
     # Prepare session configuration
     session_config = {}
@@ -130,8 +154,11 @@ def start(
 @app.command()
 def status():
     """Show orchestrator status."""
+    from rich.table import Table
+    from ..core.claude_orchestrator import ClaudeOrchestrator
     
-    orchestrator = ClaudeOrchestrator()
+    console = _get_console()
+    orchestrator = ClaudeOrchestrator(enable_web_dashboard=False)
     status = orchestrator.get_status()
     
     # Create status table
@@ -159,10 +186,13 @@ def status():
 @app.command()
 def test():
     """Test Claude CLI integration."""
+    import asyncio
+    from ..core.claude_orchestrator import ClaudeOrchestrator
     
+    console = _get_console()
     console.print("[blue]🧪 Testing Claude CLI integration...[/blue]")
     
-    orchestrator = ClaudeOrchestrator()
+    orchestrator = ClaudeOrchestrator(enable_web_dashboard=False)
     
     async def run_test():
         try:
@@ -193,7 +223,10 @@ def simulate(
     )
 ):
     """Simulate trading cycles for testing."""
+    import asyncio
+    from ..core.claude_orchestrator import ClaudeOrchestrator
     
+    console = _get_console()
     console.print(f"[blue]🎭 Simulating {cycles} trading cycles...[/blue]")
     
     orchestrator = ClaudeOrchestrator()
@@ -228,8 +261,11 @@ def history(
     limit: int = typer.Option(10, "--limit", "-l", help="Number of recent trades to show")
 ):
     """Show trading history from orchestrator."""
+    from rich.table import Table
+    from ..core.claude_orchestrator import ClaudeOrchestrator
     
-    orchestrator = ClaudeOrchestrator()
+    console = _get_console()
+    orchestrator = ClaudeOrchestrator(enable_web_dashboard=False)
     
     if not orchestrator.trade_history:
         console.print("[yellow]No trading history found[/yellow]")
@@ -245,24 +281,20 @@ def history(
     table.add_column("Monitoring Cycles", style="blue")
     
     for trade in recent_trades:
+        initiated_at = trade["initiated_at"]
+        
         duration = "N/A"
-        if trade.get("completed_at") and trade.get("initiated_at"):
-            start = trade["initiated_at"]
-            end = trade["completed_at"]
-            duration_delta = end - start
-            duration = f"{duration_delta.total_seconds() / 3600:.1f}h"
+        if trade.get("completed_at") and initiated_at:
+            duration = f"{(trade['completed_at'] - initiated_at).total_seconds() / 3600:.1f}h"
         
         monitoring_cycles = "N/A"
-        if trade.get("last_monitored") and trade.get("initiated_at"):
+        if trade.get("last_monitored") and initiated_at:
             # Estimate monitoring cycles based on time difference
-            start = trade["initiated_at"]
-            last = trade["last_monitored"]
-            time_diff = (last - start).total_seconds()
-            cycles = int(time_diff / (15 * 60)) + 1  # 15 min intervals
-            monitoring_cycles = str(cycles)
+            time_diff = (trade["last_monitored"] - initiated_at).total_seconds()
+            monitoring_cycles = str(int(time_diff // _HISTORY_CYCLE_SECONDS) + 1)
         
         table.add_row(
-            trade["initiated_at"].strftime("%Y-%m-%d %H:%M"),
+            initiated_at.strftime("%Y-%m-%d %H:%M"),
             duration,
             trade["status"],
             monitoring_cycles
@@ -280,12 +312,14 @@ def config(
     interval: int = typer.Option(None, "--interval", help="Set monitoring interval in minutes")
 ):
     """Manage trading configuration."""
+    from rich.panel import Panel
     
-    orchestrator = ClaudeOrchestrator()
+    console = _get_console()
     
     if show:
-        # Show current configuration
-        config = orchestrator.config
+        # Show current configuration - only the orchestrator's config loading is needed here
+        from ..core.claude_orchestrator import ClaudeOrchestrator
+        config = ClaudeOrchestrator(enable_web_dashboard=False).config
         
         console.print(Panel.fit(
             "[bold blue]📋 Current Trading Configuration[/bold blue]",
@@ -315,52 +349,68 @@ def config(
         console.print(f"\n[bold]Completion Keywords:[/bold] {', '.join(advanced['completion_keywords'])}")
         
     elif edit:
-        # Open config file for editing
-        import subprocess
+        # Open config file for editing, preferring the user's $VISUAL/$EDITOR
         config_path = "config/claude_trader.yaml"
-        try:
-            subprocess.run(["open", config_path])  # macOS
+        
+        editor = shlex.split(os.environ.get("VISUAL") or os.environ.get("EDITOR") or "")
+        if editor and shutil.which(editor[0]):
+            console.print(f"[green]✅ Opening {config_path} with {editor[0]}[/green]")
+            sys.stdout.flush()
+            os.execvp(editor[0], editor + [config_path])  # Replaces this process
+        
+        # Fall back to the desktop opener for this platform, then VS Code
+        opener = None
+        for candidate in ("open" if sys.platform == "darwin" else "xdg-open", "code"):
+            opener = shutil.which(candidate)
+            if opener:
+                break
+        
+        if opener:
+            import subprocess
+            subprocess.run([opener, config_path])
             console.print(f"[green]✅ Opened {config_path} for editing[/green]")
-        except:
-            try:
-                subprocess.run(["code", config_path])  # VS Code
-                console.print(f"[green]✅ Opened {config_path} in VS Code[/green]")
-            except:
-                console.print(f"[yellow]Please edit {config_path} manually[/yellow]")
-    
-    elif style or coins or interval:
+        else:
+            console.print(f"[yellow]Please edit {config_path} manually[/yellow]")
+    
+    elif style or coins or interval is not None:
+        # Validate the requested settings before touching the config file
+        if style and style not in _VALID_STYLES:
+            console.print("[red]❌ Invalid style. Choose: aggressive, moderate, cautious, conservative[/red]")
+            return
+        
+        if coins:
+            coin_list = [coin.strip().upper() for coin in coins.split(',') if coin.strip()]
+            if not coin_list:
+                console.print("[red]❌ Specify at least one coin, e.g. BTC,ETH,SOL[/red]")
+                return
+        
+        if interval is not None and (interval < 1 or interval > 60):
+            console.print("[red]❌ Interval must be between 1 and 60 minutes[/red]")
+            return
+        
         # Update specific settings
-        import yaml
+        from ..core.config_cache import load_yaml, save_yaml
         config_path = "config/claude_trader.yaml"
         
         try:
             # Load current config
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(config_path)
             
             # Update settings
             if style:
-                if style not in ['aggressive', 'moderate', 'cautious', 'conservative']:
-                    console.print("[red]❌ Invalid style. Choose: aggressive, moderate, cautious, conservative[/red]")
-                    return
                 config['trading']['style'] = style
                 console.print(f"[green]✅ Trading style set to: {style}[/green]")
             
             if coins:
-                coin_list = [coin.strip().upper() for coin in coins.split(',')]
                 config['trading']['coins'] = coin_list
                 console.print(f"[green]✅ Coins set to: {', '.join(coin_list)}[/green]")
             
-            if interval:
-                if interval < 1 or interval > 60:
-                    console.print("[red]❌ Interval must be between 1 and 60 minutes[/red]")
-                    return
+            if interval is not None:
                 config['trading']['monitoring_interval'] = interval
                 console.print(f"[green]✅ Monitoring interval set to: {interval} minutes[/green]")
             
             # Save updated config
-            with open(config_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            save_yaml(config_path, config)
             
             console.print(f"[green]✅ Configuration updated in {config_path}[/green]")
             
@@ -382,6 +432,9 @@ def dashboard(
     open_browser: bool = typer.Option(True, "--open/--no-open", help="Open browser automatically")
 ):
     """Start the web dashboard for trade auditing."""
+    from rich.panel import Panel
+    
+    console = _get_console()
     
     try:
         from ..web.dashboard import create_dashboard
@@ -399,16 +452,9 @@ def dashboard(
         
         if open_browser:
             import webbrowser
-            import threading
-            import time
-            
-            def open_browser_delayed():
-                time.sleep(2)  # Wait for server to start
-                webbrowser.open(f"http://localhost:{port}")
-            
-            threading.Thread(target=open_browser_delayed, daemon=True).start()
-        
-        dashboard.run(debug=False)
+            dashboard.run(debug=False, on_ready=lambda: webbrowser.open(f"http://localhost:{port}"))
+        else:
+            dashboard.run(debug=False)
         
     except ImportError:
         console.print("[red]❌ Web dashboard dependencies not available[/red]")
@@ -419,10 +465,14 @@ def dashboard(
 
 @app.command()
 def skip(
-    reason: str = typer.Option("Manual intervention", "--reason", "-r", help="Reason for skipping current trade")
+    reason: str = typer.Option("Manual intervention", "--reason", "-r", help="Reason for skipping current trade"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip without asking for confirmation")
 ):
     """Skip the current trade and move to the next one."""
+    from rich.panel import Panel
+    from ..core.claude_orchestrator import ClaudeOrchestrator
     
+    console = _get_console()
     orchestrator = ClaudeOrchestrator()
     
     if not orchestrator.current_trade:
@@ -442,21 +492,12 @@ def skip(
     console.print(f"  Last Monitored: {trade.get('last_monitored', 'Never')}")
     
     # Confirm skip
-    confirm = typer.confirm(f"\nAre you sure you want to skip this trade? Reason: {reason}")
+    confirm = yes or _confirm(f"\nAre you sure you want to skip this trade? Reason: {reason}")
     
     if confirm:
         # Force complete the current trade
         final_response = f"Trade manually skipped by user. Reason: {reason}"
-        orchestrator._complete_current_trade(final_response)
-        
-        # Update the completion reason in the audit system
-        if orchestrator.auditor and orchestrator.current_trade_id:
-            completion_data = {
-                "completed_at": datetime.now(),
-                "final_response": final_response,
-                "completion_reason": f"Manual skip: {reason}"
-            }
-            orchestrator.auditor.log_trade_completion(orchestrator.current_trade_id, completion_data)
+        orchestrator._complete_current_trade(final_response, completion_reason=f"Manual skip: {reason}")
         
         console.print(f"[green]✅ Trade skipped successfully[/green]")
         console.print(f"[green]📈 Ready for next trade cycle[/green]")
@@ -471,9 +512,15 @@ def skip(
 
 
 @app.command()
-def force_next():
+def force_next(
+    yes: bool = typer.Option(False, "--yes", "-y", help="Abandon an active trade without asking for confirmation")
+):
     """Force start a new trade (even if one is active)."""
+    import asyncio
+    from rich.panel import Panel
+    from ..core.claude_orchestrator import ClaudeOrchestrator
     
+    console = _get_console()
     orchestrator = ClaudeOrchestrator()
     
     console.print(Panel.fit(
@@ -489,7 +536,7 @@ def force_next():
         console.print(f"  Last Monitored: {trade.get('last_monitored', 'Never')}")
         
         # Confirm force
-        confirm = typer.confirm("\nThis will abandon the current trade and start a new one. Continue?")
+        confirm = yes or _confirm("\nThis will abandon the current trade and start a new one. Continue?")
         
         if not confirm:
             console.print("[yellow]❌ Force new trade cancelled[/yellow]")
@@ -497,16 +544,7 @@ def force_next():
         
         # Force complete current trade
         final_response = "Trade abandoned to force start new trade"
-        orchestrator._complete_current_trade(final_response)
-        
-        # Update audit system
-        if orchestrator.auditor and orchestrator.current_trade_id:
-            completion_data = {
-                "completed_at": datetime.now(),
-                "final_response": final_response,
-                "completion_reason": "Force abandoned for new trade"
-            }
-            orchestrator.auditor.log_trade_completion(orchestrator.current_trade_id, completion_data)
+        orchestrator._complete_current_trade(final_response, completion_reason="Force abandoned for new trade")
         
         console.print("[yellow]⚠️ Previous trade abandoned[/yellow]")
     
@@ -543,10 +581,10 @@ def cli_main():
     try:
         app()
     except KeyboardInterrupt:
-        console.print("\n[yellow]Operation cancelled by user[/yellow]")
+        _get_console().print("\n[yellow]Operation cancelled by user[/yellow]")
         sys.exit(0)
     except Exception as e:
-        console.print(f"[red]❌ Unexpected error: {e}[/red]")
+        _get_console().print(f"[red]❌ Unexpected error: {e}[/red]")
         sys.exit(1)
 
 
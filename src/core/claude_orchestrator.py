@@ -1,26 +1,18 @@
 """Orchestrator that wraps around the claude CLI command for 24/7 trading automation."""
 
 import asyncio
-import subprocess
 import json
-import time
 import os
-import yaml
+import random
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from datetime import datetime
+from typing import Dict, Any, Optional
 import structlog
 import re
 
-logger = structlog.get_logger(__name__)
+from .config_cache import load_yaml
 
-# Import trade auditor
-try:
-    from ..web.dashboard import TradeAuditor, create_dashboard
-except ImportError:
-    # Fallback if web dependencies not available
-    TradeAuditor = None
-    create_dashboard = None
+logger = structlog.get_logger(__name__)
 
 
 class ClaudeOrchestrator:
@@ -50,19 +42,33 @@ class ClaudeOrchestrator:
         
         self.monitoring_interval = self.config['trading']['monitoring_interval'] * 60  # Convert to seconds
         
+        # Trading prompt depends only on config, so it is built once on first use
+        self._trading_prompt = None
+        
+        # Set to end the wait between cycles early; created inside the running event loop
+        self._wakeup_event = None
+        
         # Initialize trade auditor and web dashboard with session-specific database
         self.auditor = None
         self.dashboard = None
-        if enable_web_dashboard and TradeAuditor:
+        if enable_web_dashboard:
             try:
-                db_path = f"data/trades_{self.session_name}.db"
-                self.auditor = TradeAuditor(db_path)
-                dashboard_port = 5000 + hash(self.session_name) % 1000  # Unique port per session
-                self.dashboard = create_dashboard(db_path, dashboard_port)
-                logger.info("✅ Trade auditor and web dashboard initialized", 
-                          session=self.session_name, db_path=db_path, port=dashboard_port)
-            except Exception as e:
-                logger.warning("⚠️ Failed to initialize web dashboard", error=str(e))
+                # Imported here so Flask is only loaded when the dashboard is wanted
+                from ..web.dashboard import TradeAuditor, create_dashboard
+            except ImportError:
+                # Fallback if web dependencies not available
+                TradeAuditor = None
+            
+            if TradeAuditor:
+                try:
+                    db_path = f"data/trades_{self.session_name}.db"
+                    self.auditor = TradeAuditor(db_path)
+                    dashboard_port = 5000 + hash(self.session_name) % 1000  # Unique port per session
+                    self.dashboard = create_dashboard(db_path, dashboard_port)
+                    logger.info("✅ Trade auditor and web dashboard initialized", 
+                              session=self.session_name, db_path=db_path, port=dashboard_port)
+                except Exception as e:
+                    logger.warning("⚠️ Failed to initialize web dashboard", error=str(e))
         
         # Load previous state if exists
         self._load_state()
@@ -71,21 +77,33 @@ class ClaudeOrchestrator:
         """Start 24/7 automated trading using claude CLI."""
         logger.info("🚀 Starting 24/7 Claude Trading Orchestrator")
         self.is_running = True
+        self._wakeup_event = asyncio.Event()
+        error_backoff = 1.0
         
         try:
             while self.is_running:
-                if not self.current_trade:
-                    # No active trade - start a new one
-                    await self._initiate_new_trade()
-                else:
-                    # Monitor existing trade
-                    await self._monitor_current_trade()
+                try:
+                    if not self.current_trade:
+                        # No active trade - start a new one
+                        await self._initiate_new_trade()
+                    else:
+                        # Monitor existing trade
+                        await self._monitor_current_trade()
+                    
+                    # Save state after each cycle
+                    self._save_state()
+                except Exception as e:
+                    # Unexpected cycle failure - retry with capped exponential backoff and jitter
+                    delay = min(error_backoff, self.monitoring_interval) * random.uniform(0.8, 1.2)
+                    error_backoff *= 2
+                    logger.error("❌ Trading cycle failed, retrying", error=str(e), retry_in_seconds=round(delay, 1))
+                    await self._wait_for_next_cycle(delay)
+                    continue
                 
-                # Save state after each cycle
-                self._save_state()
+                error_backoff = 1.0
                 
                 # Wait for next monitoring cycle
-                await asyncio.sleep(self.monitoring_interval)
+                await self._wait_for_next_cycle()
                 
         except KeyboardInterrupt:
             logger.info("🛑 Trading orchestrator stopped by user")
@@ -94,6 +112,16 @@ class ClaudeOrchestrator:
         finally:
             self.is_running = False
     
+    async def _wait_for_next_cycle(self, timeout: Optional[float] = None):
+        """Sleep until the next monitoring cycle, returning early if woken up."""
+        if timeout is None:
+            timeout = self.monitoring_interval
+        try:
+            await asyncio.wait_for(self._wakeup_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup_event.clear()
+    
     def _load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         if config_path is None:
@@ -105,8 +133,7 @@ class ClaudeOrchestrator:
                 logger.warning(f"Config file not found: {config_path}, using defaults")
                 return self._get_default_config()
             
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(config_path)
             
             logger.info("✅ Configuration loaded successfully", config_path=config_path)
             return config
@@ -162,6 +189,12 @@ class ClaudeOrchestrator:
     
     def _build_trading_prompt(self) -> str:
         """Build trading prompt based on configuration."""
+        if self._trading_prompt is None:
+            self._trading_prompt = self._render_trading_prompt()
+        return self._trading_prompt
+    
+    def _render_trading_prompt(self) -> str:
+        """Render the trading prompt text from the current configuration."""
         # Check for custom prompt first
         if self.config['advanced']['custom_prompt']:
             return self.config['advanced']['custom_prompt']
@@ -233,9 +266,10 @@ class ClaudeOrchestrator:
 
     async def _initiate_new_trade(self):
         """Initiate a new trade using claude CLI."""
+        trading_config = self.config['trading']
         logger.info("🎯 Initiating new trade with Claude", 
-                   style=self.config['trading']['style'],
-                   coins=self.config['trading']['coins'])
+                   style=trading_config['style'],
+                   coins=trading_config['coins'])
         
         # Build trading prompt based on configuration
         prompt = self._build_trading_prompt()
@@ -269,8 +303,8 @@ class ClaudeOrchestrator:
                 # Log to auditor
                 if self.auditor:
                     trade_data = {
-                        "style": self.config['trading']['style'],
-                        "coins": self.config['trading']['coins'],
+                        "style": trading_config['style'],
+                        "coins": trading_config['coins'],
                         "initiated_at": initiated_at,
                         "prompt": prompt,
                         "claude_response": result,
@@ -582,7 +616,23 @@ class ClaudeOrchestrator:
                            retry_attempt=retry_count)
                 
                 return None
-                
+
+        except FileNotFoundError as e:
+            # Missing binary or working directory - retrying cannot help, so fail fast with a diagnosis
+            if e.filename == cmd[0]:
+                error_analysis = self._analyze_claude_error("", "", 127)
+            else:
+                error_analysis = {
+                    "type": "Working Directory Error",
+                    "description": "Working directory for the claude command does not exist",
+                    "suggested_fix": "Create the directory or update the cwd used for claude commands"
+                }
+            logger.error("❌ Claude command could not be launched",
+                       missing_path=e.filename,
+                       error_type=error_analysis["type"],
+                       error_description=error_analysis["description"],
+                       suggested_fix=error_analysis["suggested_fix"])
+            return None
         except Exception as e:
             logger.error("❌ Error executing claude command", error=str(e))
             return None
@@ -771,8 +821,11 @@ class ClaudeOrchestrator:
         
         return False
     
-    def _complete_current_trade(self, final_response: str):
-        """Complete the current trade and prepare for next one."""
+    def _complete_current_trade(self, final_response: str, completion_reason: Optional[str] = None):
+        """Complete the current trade and prepare for next one.
+        
+        completion_reason overrides the reason extracted from final_response.
+        """
         if self.current_trade:
             completed_at = datetime.now()
             self.current_trade["completed_at"] = completed_at
@@ -784,7 +837,7 @@ class ClaudeOrchestrator:
                 completion_data = {
                     "completed_at": completed_at,
                     "final_response": final_response,
-                    "completion_reason": self._extract_completion_reason(final_response)
+                    "completion_reason": completion_reason or self._extract_completion_reason(final_response)
                 }
                 self.auditor.log_trade_completion(self.current_trade_id, completion_data)
                 logger.info("📊 Trade completion logged to audit system", trade_id=self.current_trade_id)
@@ -1205,10 +1258,17 @@ class ClaudeOrchestrator:
         except Exception as e:
             logger.error("❌ Failed to save state", error=str(e))
     
+    def request_cycle(self):
+        """Run the next trading cycle now instead of waiting out the monitoring interval."""
+        if self._wakeup_event:
+            self._wakeup_event.set()
+    
     def stop(self):
         """Stop the orchestrator and save state."""
         logger.info("🛑 Stopping Claude orchestrator")
         self.is_running = False
+        if self._wakeup_event:
+            self._wakeup_event.set()
         
         # Save current state before stopping
         self._save_state()
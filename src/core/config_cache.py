@@ -0,0 +1,36 @@
+"""Cached YAML configuration loading for the Claude Trading Orchestrator."""
+
+import copy
+import os
+from typing import Dict, Any, Tuple
+
+import yaml
+
+# Parsed configs keyed by absolute path, invalidated when the file's mtime changes
+_config_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def load_yaml(path: str) -> Dict[str, Any]:
+    """Load a YAML file, reusing the previous parse while the file is unchanged.
+
+    A deep copy is returned so callers can apply overrides without affecting the cache.
+    """
+    key = os.path.abspath(path)
+    mtime_ns = os.stat(key).st_mtime_ns
+
+    cached = _config_cache.get(key)
+    if cached is None or cached[0] != mtime_ns:
+        with open(key, 'r') as f:
+            cached = (mtime_ns, yaml.safe_load(f))
+        _config_cache[key] = cached
+
+    return copy.deepcopy(cached[1])
+
+
+def save_yaml(path: str, config: Dict[str, Any]):
+    """Write a config to a YAML file and keep the cached parse in step with it."""
+    key = os.path.abspath(path)
+    with open(key, 'w') as f:
+        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+
+    _config_cache[key] = (os.stat(key).st_mtime_ns, copy.deepcopy(config))
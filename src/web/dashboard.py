@@ -2,9 +2,9 @@
 
 import json
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 import structlog
 from flask import Flask, render_template, jsonify, request
 import threading
@@ -266,10 +266,23 @@ class TradeDashboard:
             stats = self.auditor.get_trade_stats()
             return jsonify(stats)
     
-    def run(self, debug: bool = False):
-        """Run the Flask dashboard."""
+    def run(self, debug: bool = False, on_ready: Optional[Callable[[], None]] = None):
+        """Run the Flask dashboard, calling on_ready once the server is listening.
+        
+        With on_ready the server is started through werkzeug directly, so debug
+        (reloader and debugger) is ignored on that path.
+        """
         logger.info("🌐 Starting trade dashboard", port=self.port)
-        self.app.run(host="0.0.0.0", port=self.port, debug=debug)
+        if on_ready is None:
+            self.app.run(host="0.0.0.0", port=self.port, debug=debug)
+            return
+        
+        # Bind the socket first so on_ready never races the server start, and run
+        # on_ready in its own thread since it may block (e.g. a console browser)
+        from werkzeug.serving import make_server
+        server = make_server("0.0.0.0", self.port, self.app, threaded=True)
+        threading.Thread(target=on_ready, daemon=True).start()
+        server.serve_forever()
     
     def run_in_background(self):
         """Run the dashboard in a background thread."""